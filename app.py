@@ -19,23 +19,34 @@
 技术栈：
     - Flask：Web应用框架
     - Flask-SocketIO：实时双向通信
-    - JSON：数据交换格式
+    - orjson：JSON数据交换格式的序列化
     - os：系统功能支持
 """
 
 # 应用入口文件，负责初始化Flask应用和Socket.IO，注册路由和事件处理器
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response
 from flask_socketio import SocketIO
-import json
+import hashlib
+import logging
+import orjson
 import os
 
 # 导入平台模块
 from my_modules.platform.auth import init_users, register_user, login_user, update_user_room
 from my_modules.platform.socket_events import init_socket_events
 from my_modules.platform.room_manager import RoomManager
+from my_modules.platform.json_provider import OrjsonProvider, OrjsonSocketIOJSON
 from my_modules.games.game_registry import game_registry
 
+# 配置日志，默认INFO级别只输出启动信息，逐请求的调试日志使用DEBUG级别
+# 生产环境可设置环境变量LOG_LEVEL=WARNING
+logging.basicConfig(
+    level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+    format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+)
+logger = logging.getLogger(__name__)
+
 # 初始化Flask应用
 app = Flask(__name__)
 # 配置Flask应用密钥，用于会话安全和Cookie签名
@@ -43,13 +54,16 @@ app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your-secret-key'
 # 配置JSON响应不使用ASCII编码，支持中文等非ASCII字符
 app.config['JSON_AS_ASCII'] = False
+# 使用orjson处理jsonify和request.json（orjson本身即输出UTF-8，不转义中文）
+app.json = OrjsonProvider(app)
 
 # 初始化SocketIO实例，配置CORS以允许跨域请求
 # 注意：生产环境中应限制允许的源为指定域名，而非通配符
 # 参数说明：
 #   - app: Flask应用实例
 #   - cors_allowed_origins: 允许的跨域请求来源
-socketio = SocketIO(app, cors_allowed_origins="*")
+#   - json: 使用orjson编码/解码所有Socket.IO事件数据
+socketio = SocketIO(app, cors_allowed_origins="*", json=OrjsonSocketIOJSON)
 
 # 初始化游戏注册表，用于管理和加载所有游戏
 # GameRegistry类负责动态发现、注册和实例化游戏
@@ -58,6 +72,22 @@ socketio = SocketIO(app, cors_allowed_origins="*")
 # 该过程会扫描games目录下的所有游戏模块并注册
 game_registry.initialize()
 
+# 游戏列表在启动后不再变化，预先序列化/available_games的响应体和ETag，
+# 请求时直接返回缓存的字节，浏览器可凭ETag得到304响应
+_AVAILABLE_GAMES_JSON = orjson.dumps({
+    'games': [
+        {
+            'id': game['id'],
+            'name': game['name'],
+            'description': game['description'],
+            'min_players': game['min_players'],
+            'max_players': game['max_players']
+        }
+        for game in game_registry.get_available_games()
+    ]
+})
+_AVAILABLE_GAMES_ETAG = hashlib.md5(_AVAILABLE_GAMES_JSON).hexdigest()
+
 # 初始化房间管理器，用于创建和管理游戏房间
 room_manager = RoomManager()
 
@@ -68,6 +98,30 @@ init_users()
 # 初始化Socket事件处理，传入SocketIO实例和房间管理器
 init_socket_events(socketio, room_manager)
 
+# 页面模板不包含任何按请求变化的内容，渲染结果按模板名缓存
+# 模板中的url_for需要请求上下文，因此在首次请求时渲染而不是在启动时渲染
+_page_cache = {}
+
+def render_page(template_name):
+    """
+    渲染静态页面模板并缓存结果
+    
+    参数：
+        template_name (str): templates目录下的模板文件名
+    
+    返回值：
+        str: 渲染后的HTML
+    
+    说明：
+        调试模式下每次都重新渲染，以便修改模板后立即生效
+    """
+    if app.debug:
+        return render_template(template_name)
+    html = _page_cache.get(template_name)
+    if html is None:
+        html = _page_cache[template_name] = render_template(template_name)
+    return html
+
 @app.route('/')
 def index():
     """
@@ -77,18 +131,18 @@ def index():
         返回网站首页，通常是登录页面
     
     返回值：
-        渲染后的index.html模板
+        渲染后的index.html模板（首次渲染后缓存）
     
     路由参数：无
     
     模板位置：templates/index.html
     """
-    return render_template('index.html')
+    return render_page('index.html')
 
 @app.route('/register')
 def register_page():
-    print("渲染注册页面")
-    return render_template('register.html')  # 注册页面
+    logger.debug("渲染注册页面")
+    return render_page('register.html')  # 注册页面
 
 @app.route('/registerAPI', methods=['POST'])
 def register():
@@ -171,8 +225,7 @@ def login():
         
     错误情况：
         - 缺少必要字段
-        - 用户不存在
-        - 密码错误
+        - 账号不存在或密码错误（统一返回"账号或密码错误"）
     """
     # 从请求中获取JSON数据
     data = request.json
@@ -211,7 +264,7 @@ def available_games():
     
     功能：
         获取平台上所有可用的游戏信息列表
-        这些游戏是通过游戏注册表动态加载的
+        这些游戏是通过游戏注册表动态加载的，响应体在启动时生成并缓存
     
     参数：无
     
@@ -229,19 +282,10 @@ def available_games():
             ]
         }
     """
-    # 从游戏注册表获取所有可用游戏
-    games = game_registry.get_available_games()
-    # 构造响应数据，每个游戏只返回必要信息
-    game_list = []
-    for game in games:
-        game_list.append({
-            'id': game['id'],
-            'name': game['name'],
-            'description': game['description'],
-            'min_players': game['min_players'],
-            'max_players': game['max_players']
-        })
-    return jsonify({'games': game_list})
+    # 返回启动时预先生成的响应体
+    response = Response(_AVAILABLE_GAMES_JSON, mimetype='application/json')
+    response.set_etag(_AVAILABLE_GAMES_ETAG)
+    return response.make_conditional(request)
 
 @app.route('/rooms')
 def rooms():
@@ -254,6 +298,7 @@ def rooms():
     功能：
         获取平台上所有活跃的游戏房间信息
         包括房间ID、房主、玩家列表、是否已选游戏等信息
+        响应体由RoomManager缓存，房间未变化时不重新序列化
     
     参数：无
     
@@ -271,17 +316,8 @@ def rooms():
             ]
         }
     """
-    room_list = []
-    # 遍历所有房间，收集房间信息
-    for room_id, room in room_manager.rooms.items():
-        room_list.append({
-            'id': room_id,
-            'host': room.host_account,  # 房主账号
-            'players': list(room.players.keys()),  # 所有玩家账号列表
-            'game_selected': room.selected_game,  # 是否已选择游戏
-            'started': room.game_started  # 游戏是否已开始
-        })
-    return jsonify({'rooms': room_list})
+    # 房间摘要由房间管理器缓存，只在房间变化后重新生成
+    return Response(room_manager.get_rooms_summary_json(), mimetype='application/json')
 
 @app.route('/roulette')
 def roulette():
@@ -298,10 +334,10 @@ def roulette():
     参数：无
     
     返回值：
-        渲染后的roulette.html模板
+        渲染后的roulette.html模板（首次渲染后缓存）
     """
-    print("访问了roulette路由")
-    return render_template('roulette.html')
+    logger.debug("访问了roulette路由")
+    return render_page('roulette.html')
 
 
 @app.route('/ccb')
@@ -319,18 +355,18 @@ def ccb():
     参数：无
     
     返回值：
-        渲染后的ccb.html模板
+        渲染后的ccb.html模板（首次渲染后缓存）
     """
-    print("访问了ccb路由")
-    return render_template('ccb.html')
+    logger.debug("访问了ccb路由")
+    return render_page('ccb.html')
 
 @app.route('/stew')
 def stew():
     """
     Stew游戏页面路由
     """
-    print("访问了stew路由")
-    return render_template('stew.html')
+    logger.debug("访问了stew路由")
+    return render_page('stew.html')
 
 if __name__ == '__main__':
     """
@@ -348,7 +384,8 @@ if __name__ == '__main__':
     
     注意：
         - 生产环境中应关闭调试模式
-        - 可能需要配置反向代理和Werkzeug服务器以外的WSGI服务器
+        - 这里使用的是Werkzeug开发服务器，并发连接数有限；
+          生产环境请通过wsgi.py使用gunicorn + eventlet启动
     """
     # 确保static文件夹存在，用于存放静态资源
     if not os.path.exists('static'):
@@ -359,7 +396,7 @@ if __name__ == '__main__':
         os.makedirs('templates')
     
     # 启动SocketIO服务器
-    print("游戏平台启动中...")
-    print(f"游戏数量: {len(game_registry.get_available_games())}")
+    logger.info("游戏平台启动中...")
+    logger.info("游戏数量: %d", len(game_registry.get_available_games()))
     #socketio.run(app, debug=True, host='0.0.0.0', port=5000)
     socketio.run(app, debug=False, host='0.0.0.0', port=5000)
@@ -1,6 +1,18 @@
 from my_modules.games.base import BaseGame
+from dataclasses import dataclass
 import random
 
+
+@dataclass
+class RoulettePlayer:
+    """
+    Roulette玩家记录
+    使用__slots__，每个玩家不再携带一个独立的dict
+    """
+    __slots__ = ('order',)
+    order: int
+
+
 class RouletteGame(BaseGame):
     """
     Roulette轮盘赌游戏
@@ -28,9 +40,7 @@ class RouletteGame(BaseGame):
             self.host = account
         
         order = len(self.players) + 1
-        self.players[account] = {
-            'order': order
-        }
+        self.players[account] = RoulettePlayer(order)
         return order
     
     def leave(self, account):
@@ -129,7 +139,8 @@ class RouletteGame(BaseGame):
     def get_state(self,account=0):
         return {
             'game_type': self.game_type,
-            'players': self.players,
+            # 转换为与之前相同的 {账号: {'order': 顺序}} 格式（每次调用都会生成新的字典）
+            'players': {acc: {'order': player.order} for acc, player in self.players.items()},
             'started': self.started,
             'host': self.host,
             'cards_state': self.get_cards_state(),
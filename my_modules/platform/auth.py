@@ -15,27 +15,73 @@
     - HTTP认证路由提供
 
 技术细节：
-    - 使用werkzeug.security进行密码加密和验证
-    - 用户数据存储在JSON文件中
+    - 使用argon2id进行密码加密和验证，旧的werkzeug哈希（pbkdf2/scrypt）在登录成功时自动迁移
+    - 用户数据存储在JSON文件中，启动时加载到内存缓存，读操作不再访问磁盘
+    - 写操作只修改内存缓存，并在短暂延迟后合并写回文件（临时文件 + os.replace 原子替换）
+    - 设置环境变量REDIS_URL后session token存放在Redis中（依赖redis包），过期由Redis的TTL处理
     - 提供RESTful API接口供前端调用
 """
 
 # 负责用户注册、登录和会话管理功能
 
 from flask import request, jsonify
-from werkzeug.security import generate_password_hash, check_password_hash
-import json
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+import atexit
+import heapq
+import logging
+import orjson
 import os
 import secrets
-from datetime import datetime, timedelta
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
 
 # 用户数据文件路径
 # 该文件存储所有用户账号信息，包括加密后的密码和用户属性
 USER_FILE = "users.json"
 
-# Token存储 (在内存中管理所有活跃的session tokens)
-active_tokens = {}  # {token: {"account": account, "created_at": datetime, "expires_at": datetime}}
+# 用户数据的内存缓存 (首次加载后所有读写都在这里进行，文件只用于持久化)
+_users_cache = None
+# 保护用户缓存的锁 (注册时的"检查-插入"和写回文件时的快照都需要加锁)
+_users_lock = threading.RLock()
+# 写回users.json的后台线程（单线程，保证写文件按顺序进行）
+_persist_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="users-persist")
+# 是否已有一次写回在排队，500ms内的多次修改合并为一次写文件
+_flush_pending = False
+FLUSH_DELAY = 0.5
+
+# argon2id密码哈希器
+# 参数取自OWASP推荐的最低配置（19MiB内存，2次迭代），单次验证约数毫秒，
+# 远低于werkzeug默认pbkdf2:sha256（60万次迭代）的CPU开销
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+# 账号不存在时用于验证的虚拟哈希，使账号不存在和密码错误两种情况的耗时一致
+# （两种情况返回相同的提示信息，配合相同的耗时，无法据此判断账号是否存在）
+_DUMMY_HASH = _password_hasher.hash(secrets.token_urlsafe(16))
+
+# Token有效期（秒）
+TOKEN_TTL = 7 * 24 * 3600
+
+# Redis连接地址，配置后token存放在Redis中，多个worker进程可以共享登录状态
+# 未配置时使用下面的进程内字典（单进程部署）
+REDIS_URL = os.environ.get("REDIS_URL")
+_redis = None
+if REDIS_URL:
+    import redis
+    _redis = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+
+# Token存储 (在内存中管理所有活跃的session tokens，仅在未配置Redis时使用)
+active_tokens = {}  # {token: {"account": account, "created_at": float, "expires_at": float}}，时间为time.monotonic()秒数
 user_tokens = {}  # {account: token} - 用于快速查找用户的当前token
+# 按过期时间排序的最小堆 [(expires_at, token)]，创建token时顺带清理已过期的token，
+# 避免从不登出、也不再访问的用户的token一直留在内存中
+_expiry_heap = []
+_tokens_lock = threading.Lock()
 
 def init_users():
     """
@@ -47,6 +93,7 @@ def init_users():
     
     处理流程：
         1. 检查用户数据文件是否存在，不存在则创建空文件
+           （文件格式错误时load_users抛出异常，启动失败且不覆盖原文件）
         2. 从文件加载现有用户数据
         3. 遍历所有用户记录，确保每个用户都有room字段
         4. 如果进行了字段补充，将更新后的数据保存回文件
@@ -57,91 +104,222 @@ def init_users():
     
     返回值：无
     """
+    global _users_cache
     if not os.path.exists(USER_FILE):
         # 如果文件不存在，创建空文件
-        with open(USER_FILE, 'w', encoding='utf-8') as f:
-            json.dump({}, f, indent=4, ensure_ascii=False)
-        print(f"创建新的用户数据文件: {USER_FILE}")
+        with _users_lock:
+            _users_cache = {}
+        _flush_users()
+        logger.info("创建新的用户数据文件: %s", USER_FILE)
         return
     
     # 读取并更新用户数据
-    with open(USER_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # 确保每个用户都有room字段
-    for user in data.values():
-        user['room'] = None
+    with _users_lock:
+        data = load_users()
+        
+        # 确保每个用户都有room字段
+        for user in data.values():
+            user['room'] = None
     
     # 如果有更新，保存更新后的数据
-    with open(USER_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
-    print("用户数据结构已更新，确保所有用户都没有房间字段")
+    _flush_users()
+    logger.info("用户数据结构已更新，确保所有用户都没有房间字段")
 
 def load_users():
     """
-    从users.json文件中读取所有用户信息
+    获取所有用户信息
     
     返回值：
         dict: 用户信息字典，键为账号，值为用户详细信息
-              如果文件不存在或格式错误，返回空字典
+              如果文件不存在，返回空字典
     
     核心作用：
         - 提供统一的用户数据加载接口，抽象文件操作细节
+        - 只在第一次调用时读取users.json，之后直接返回内存缓存
         - 异常处理确保系统稳定性
-        - 日志记录便于调试和监控
+    
+    注意事项：
+        - 返回的是缓存字典本身，调用方修改后需调用save_users安排写回
     
     异常处理：
         - 文件不存在时返回空字典
-        - JSON格式错误时返回空字典并记录警告日志
+        - JSON格式错误时记录错误日志并抛出orjson.JSONDecodeError，不修改文件
+          （init_users在启动时调用，因此文件损坏时应用启动失败）
     
     日志输出：
-        - 成功加载时显示用户数量
+        - 首次加载成功时显示用户数量（每次启动只输出一次）
         - 文件不存在或格式错误时显示错误信息
     """
-    if not os.path.exists(USER_FILE):
-        print(f"用户数据文件不存在: {USER_FILE}")
-        return {}  # 若文件不存在，返回空字典
+    global _users_cache
+    if _users_cache is not None:
+        return _users_cache
     
-    try:
-        with open(USER_FILE, "r", encoding="utf-8") as f:
-            users_data = json.load(f)
-        print(f"成功加载用户数据，共 {len(users_data)} 个用户")
-        return users_data
-    except json.JSONDecodeError as e:
-        print(f"警告: 用户数据文件格式错误 - {str(e)}")
-        return {}  # 若文件损坏或格式错误，返回空字典
+    with _users_lock:
+        if _users_cache is not None:
+            return _users_cache
+        
+        if not os.path.exists(USER_FILE):
+            logger.warning("用户数据文件不存在: %s", USER_FILE)
+            _users_cache = {}  # 若文件不存在，使用空字典
+            return _users_cache
+        
+        try:
+            with open(USER_FILE, "rb") as f:
+                _users_cache = orjson.loads(f.read())
+            logger.info("成功加载用户数据，共 %d 个用户", len(_users_cache))
+        except orjson.JSONDecodeError as e:
+            # 不缓存空字典，否则随后的写回会用空数据覆盖损坏的文件，丢失所有账号
+            logger.error("用户数据文件格式错误，请修复或移走 %s 后重新启动 - %s", USER_FILE, e)
+            raise
+        return _users_cache
 
 def save_users(users):
     """
-    将内存中的用户数据保存回users.json文件
+    将内存中的用户数据安排写回users.json文件
     
     参数：
         users (dict): 用户信息字典，包含所有需要持久化的用户数据
     
     核心作用：
-        - 确保用户数据的持久化存储
-        - 格式化JSON输出，提高文件可读性和可维护性
-        - 异常处理确保程序稳定性
+        - 更新内存缓存，使后续读取立即看到最新数据
+        - 提交到后台写线程，延迟FLUSH_DELAY秒后写文件，期间的多次修改合并为一次写入
+    
+    返回值：无
+    """
+    global _users_cache, _flush_pending
+    with _users_lock:
+        _users_cache = users
+        if _flush_pending:
+            return
+        _flush_pending = True
+    
+    try:
+        _persist_executor.submit(_delayed_flush)
+    except RuntimeError:
+        # 解释器正在退出，线程池不再接受任务，直接同步写入
+        _flush_users()
+
+def _delayed_flush():
+    """
+    在后台线程中等待FLUSH_DELAY秒后写回文件，使这段时间内的修改合并为一次写入
+    """
+    time.sleep(FLUSH_DELAY)
+    _flush_users()
+
+def _flush_users():
+    """
+    立即将用户缓存写入users.json文件
     
     技术特点：
-        - 使用utf-8编码确保中文字符正确保存
-        - 缩进为4的JSON格式，提高可读性
+        - 持锁序列化快照，写文件时不阻塞其他请求
+        - 先写入临时文件并fsync，再os.replace，避免进程或系统中断时留下半个文件
+        - 正常情况下在后台线程中执行，注册和更新房间的请求不等待磁盘
+        - fsync会阻塞调用它的系统线程，因此写文件部分经由_run_blocking执行，
+          在eventlet部署下放到tpool的真实线程中，代价是每次写回多一次线程间切换
+        - 使用orjson序列化，输出utf-8编码确保中文字符正确保存
     
     异常处理：
         - 捕获可能的写入异常，记录错误日志但不中断程序
     
-    日志输出：
-        - 成功保存时显示用户数量
-        - 保存失败时显示错误信息
-    
     返回值：无
     """
+    global _flush_pending
+    with _users_lock:
+        _flush_pending = False
+        if _users_cache is None:
+            return
+        content = orjson.dumps(_users_cache, option=orjson.OPT_INDENT_2)
+        count = len(_users_cache)
+    
     try:
-        with open(USER_FILE, "w", encoding="utf-8") as f:
-            json.dump(users, f, indent=4, ensure_ascii=False)
-        print(f"用户数据已保存，共 {len(users)} 个用户")
+        _run_blocking(_write_users_file, content)
+        logger.debug("用户数据已保存，共 %d 个用户", count)
     except Exception as e:
-        print(f"保存用户数据失败: {str(e)}")
+        logger.error("保存用户数据失败: %s", e)
+
+def _write_users_file(content):
+    """
+    将序列化后的用户数据写入临时文件、fsync，再原子替换users.json
+    
+    参数：
+        content (bytes): 序列化后的用户数据
+    """
+    tmp_file = USER_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, USER_FILE)
+
+def _run_blocking(func, *args):
+    """
+    在真正的操作系统线程中执行阻塞的磁盘操作
+    
+    说明：
+        - 通过wsgi.py使用eventlet启动时，threading已被monkey patch，
+          _persist_executor的"后台线程"只是运行在同一个系统线程上的greenlet，
+          而eventlet不会把os.fsync变成非阻塞调用，直接调用会卡住所有WebSocket客户端。
+          此时改用eventlet.tpool在真实线程池中执行
+        - 未使用eventlet时（python app.py），后台线程本身就是系统线程，直接执行
+    """
+    patcher = sys.modules.get("eventlet.patcher")
+    if patcher is not None and patcher.is_monkey_patched("thread"):
+        from eventlet import tpool
+        return tpool.execute(func, *args)
+    return func(*args)
+
+# 进程退出前写回尚未落盘的修改
+atexit.register(_flush_users)
+
+def hash_password(password):
+    """
+    计算密码的argon2id哈希
+    
+    参数：
+        password (str): 明文密码
+    
+    返回值：
+        str: 带参数和盐的argon2id哈希字符串，可直接存入用户数据
+    """
+    return _password_hasher.hash(password)
+
+def verify_password(password_hash, password):
+    """
+    验证密码是否与存储的哈希匹配
+    
+    参数：
+        password_hash (str): 用户数据中存储的密码哈希
+        password (str): 待验证的明文密码
+    
+    返回值：
+        bool: 密码是否正确
+    
+    兼容性：
+        - 以"$argon2"开头的哈希由argon2验证
+        - 其他格式均为werkzeug生成的旧哈希（pbkdf2、scrypt等），交给check_password_hash验证
+    """
+    if not isinstance(password, str):
+        return False
+    if password_hash.startswith("$argon2"):
+        try:
+            return _password_hasher.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return check_password_hash(password_hash, password)
+
+def password_needs_rehash(password_hash):
+    """
+    判断存储的哈希是否需要用当前参数重新计算
+    
+    参数：
+        password_hash (str): 用户数据中存储的密码哈希
+    
+    返回值：
+        bool: 非argon2格式的旧哈希或参数与当前配置不同的argon2哈希返回True
+    """
+    if not password_hash.startswith("$argon2"):
+        return True
+    return _password_hasher.check_needs_rehash(password_hash)
 
 def register_user(account, password, game_id):
     """
@@ -166,7 +344,7 @@ def register_user(account, password, game_id):
         5. 保存更新后的用户数据到文件
     
     安全特性：
-        - 密码使用PBKDF2-SHA256算法加密存储
+        - 密码使用argon2id算法加密存储
         - 不存储明文密码
     
     日志输出：
@@ -174,28 +352,37 @@ def register_user(account, password, game_id):
     """
     # 基本输入校验
     if not account or not password or not game_id:
-        print("注册失败: 账号、密码或游戏ID为空")
+        logger.debug("注册失败: 账号、密码或游戏ID为空")
         return {"ok": False, "msg": "账号、密码和ID不能为空"}
     
-    users = load_users()
-    
-    # 检查账号是否已存在
-    if account in users:
-        print(f"注册失败: 账号 {account} 已存在")
+    # 先快速检查账号是否已存在，避免为注定失败的注册计算哈希
+    if account in load_users():
+        logger.debug("注册失败: 账号 %s 已存在", account)
         return {"ok": False, "msg": "账号已存在"}
     
-    # 创建新用户，密码加密存储
-    users[account] = {
-        "account": account,
-        "ID": game_id,
-        "password": generate_password_hash(password, method="pbkdf2:sha256"),  # 使用安全哈希存储密码
-        "room": None  # 初始未在任何房间
-    }
+    # 在锁外计算哈希，避免慢操作阻塞其他请求
+    password_hash = hash_password(password)  # 使用安全哈希存储密码
     
-    # 保存用户数据
-    save_users(users)
+    with _users_lock:
+        users = load_users()
+        
+        # 加锁后再次检查，防止计算哈希期间同名账号被并发注册
+        if account in users:
+            logger.debug("注册失败: 账号 %s 已存在", account)
+            return {"ok": False, "msg": "账号已存在"}
+        
+        # 创建新用户，密码加密存储
+        users[account] = {
+            "account": account,
+            "ID": game_id,
+            "password": password_hash,
+            "room": None  # 初始未在任何房间
+        }
+        
+        # 保存用户数据
+        save_users(users)
     
-    print(f"新用户注册成功: 账号={account}, 游戏ID={game_id}")
+    logger.debug("新用户注册成功: 账号=%s, 游戏ID=%s", account, game_id)
     return {"ok": True, "msg": "注册成功"}
 
 def generate_session_token():
@@ -225,32 +412,68 @@ def create_token(account):
         1. 如果用户已有token，先删除旧token
         2. 生成新的随机token
         3. 设置token过期时间（7天）
-        4. 将token信息存储到active_tokens字典
-        5. 更新user_tokens映射以便快速查找
+        4. 将token信息存储到active_tokens字典（或Redis的tok:<token>键）
+        5. 更新user_tokens映射（或Redis的usr:<account>键）以便快速查找
+        6. 清理堆顶已过期的token（仅内存存储）
     
     日志输出：
         - 记录为哪个用户创建了新token
     """
+    if _redis is not None:
+        token = generate_session_token()
+        old_token = _redis.get(f"usr:{account}")
+        pipe = _redis.pipeline()
+        if old_token:
+            pipe.delete(f"tok:{old_token}")
+        pipe.setex(f"tok:{token}", TOKEN_TTL, account)
+        pipe.setex(f"usr:{account}", TOKEN_TTL, token)
+        pipe.execute()
+        logger.debug("为用户 %s 创建新token", account)
+        return token
+    
     # 如果用户已有token，先删除旧token
-    if account in user_tokens:
-        old_token = user_tokens[account]
-        if old_token in active_tokens:
-            del active_tokens[old_token]
+    # 使用pop而不是先检查再del，避免与并发的过期清理冲突导致KeyError
+    old_token = user_tokens.get(account)
+    if old_token is not None:
+        active_tokens.pop(old_token, None)
     
     # 生成新token
     token = generate_session_token()
-    expires_at = datetime.now() + timedelta(days=7)  # token 7天后过期
+    now = time.monotonic()
+    expires_at = now + TOKEN_TTL  # token 7天后过期
     
     active_tokens[token] = {
         "account": account,
-        "created_at": datetime.now(),
+        "created_at": now,
         "expires_at": expires_at
     }
     user_tokens[account] = token
     
-    print(f"为用户 {account} 创建新token")
+    with _tokens_lock:
+        heapq.heappush(_expiry_heap, (expires_at, token))
+        _sweep_expired_tokens(now)
+    
+    logger.debug("为用户 %s 创建新token", account)
     return token
 
+def _sweep_expired_tokens(now):
+    """
+    从过期堆中弹出并删除所有已过期的token
+    
+    参数：
+        now (float): 当前的time.monotonic()秒数
+    
+    说明：
+        - 调用方需持有_tokens_lock
+        - 堆中可能有已撤销或已被替换的token，删除时按值判断，不会误删新token
+        - 每个token只入堆一次，总开销与创建的token数量成正比
+    """
+    while _expiry_heap and _expiry_heap[0][0] <= now:
+        _, token = heapq.heappop(_expiry_heap)
+        token_info = active_tokens.pop(token, None)
+        if token_info and user_tokens.get(token_info["account"]) == token:
+            user_tokens.pop(token_info["account"], None)
+
 def verify_token(token):
     """
     验证token是否有效
@@ -264,25 +487,30 @@ def verify_token(token):
     功能流程：
         1. 检查token是否存在于active_tokens中
         2. 检查token是否已过期
-        3. 如果过期，删除相关记录
+        3. 如果过期，删除相关记录（使用Redis时由键的TTL自动过期）
         4. 如果有效，返回对应的账号
     
     日志输出：
         - 记录token过期和删除的情况
     """
-    if not token or token not in active_tokens:
+    if not token:
         return None
     
-    token_info = active_tokens[token]
+    if _redis is not None:
+        return _redis.get(f"tok:{token}")
+    
+    token_info = active_tokens.get(token)
+    if token_info is None:
+        return None
     
     # 检查是否过期
-    if datetime.now() > token_info["expires_at"]:
+    if time.monotonic() > token_info["expires_at"]:
         # Token已过期，删除它
         account = token_info["account"]
-        del active_tokens[token]
-        if account in user_tokens and user_tokens[account] == token:
-            del user_tokens[account]
-        print(f"Token已过期并被删除")
+        active_tokens.pop(token, None)
+        if user_tokens.get(account) == token:
+            user_tokens.pop(account, None)
+        logger.debug("Token已过期并被删除")
         return None
     
     return token_info["account"]
@@ -305,12 +533,24 @@ def revoke_token(token):
     日志输出：
         - 记录token撤销操作
     """
-    if token in active_tokens:
-        account = active_tokens[token]["account"]
-        del active_tokens[token]
-        if account in user_tokens and user_tokens[account] == token:
-            del user_tokens[account]
-        print(f"Token已撤销: 用户 {account}")
+    if _redis is not None:
+        account = _redis.get(f"tok:{token}") if token else None
+        if not account:
+            return False
+        pipe = _redis.pipeline()
+        pipe.delete(f"tok:{token}")
+        if _redis.get(f"usr:{account}") == token:
+            pipe.delete(f"usr:{account}")
+        pipe.execute()
+        logger.debug("Token已撤销: 用户 %s", account)
+        return True
+    
+    token_info = active_tokens.pop(token, None)
+    if token_info is not None:
+        account = token_info["account"]
+        if user_tokens.get(account) == token:
+            user_tokens.pop(account, None)
+        logger.debug("Token已撤销: 用户 %s", account)
         return True
     return False
 
@@ -332,14 +572,17 @@ def login_user(account, password):
             }
     
     功能流程：
-        1. 加载所有用户数据
+        1. 校验账号非空、密码为字符串，加载所有用户数据
         2. 检查指定账号是否存在于系统中
         3. 使用哈希验证函数检查密码是否匹配
-        4. 登录成功时，生成session token
-        5. 构建包含公开信息的用户数据（排除密码等敏感信息）
+        4. 旧格式的密码哈希重新计算为argon2id并保存
+        5. 登录成功时，生成session token
+        6. 构建包含公开信息的用户数据（排除密码等敏感信息）
     
     安全特性：
-        - 使用check_password_hash验证密码，防止时序攻击
+        - 使用verify_password验证密码，防止时序攻击
+        - 账号不存在时验证虚拟哈希，响应时间与密码错误时一致
+        - 账号不存在和密码错误返回相同的提示信息，不泄露账号是否存在
         - 返回数据中不包含密码等敏感信息
         - 生成随机session token用于后续认证
     
@@ -347,18 +590,34 @@ def login_user(account, password):
         - 记录登录尝试和结果，包括成功/失败原因
         - 记录登录用户的基本信息（账号、游戏ID、当前房间）
     """
+    # 基本输入校验（Socket登录事件会把缺失的密码原样传进来）
+    if not account or not isinstance(password, str):
+        logger.debug("登录失败: 账号或密码为空")
+        return {"ok": False, "msg": "用户名和密码不能为空"}
+    
     users = load_users()
     user = users.get(account)
     
+    # 无论账号是否存在都做一次哈希验证，防止通过响应时间探测账号是否存在
+    password_ok = verify_password(user["password"] if user else _DUMMY_HASH, password)
+    
     # 检查用户是否存在
     if not user:
-        print(f"登录失败: 用户 {account} 不存在")
-        return {"ok": False, "msg": "用户不存在"}
+        logger.debug("登录失败: 用户 %s 不存在", account)
+        return {"ok": False, "msg": "账号或密码错误"}
     
     # 检查密码是否正确
-    if not check_password_hash(user["password"], password):
-        print(f"登录失败: 用户 {account} 密码错误")
-        return {"ok": False, "msg": "密码错误"}
+    if not password_ok:
+        logger.debug("登录失败: 用户 %s 密码错误", account)
+        return {"ok": False, "msg": "账号或密码错误"}
+    
+    # 旧格式的哈希在密码验证通过后重新计算并保存
+    if password_needs_rehash(user["password"]):
+        new_hash = hash_password(password)
+        with _users_lock:
+            user["password"] = new_hash
+            save_users(users)
+        logger.info("用户 %s 的密码哈希已迁移到argon2id", account)
     
     # 生成session token
     token = create_token(account)
@@ -370,7 +629,7 @@ def login_user(account, password):
         "room": user.get("room")
     }
     
-    print(f"用户登录成功: 账号={account}, 游戏ID={user['ID']}, 当前房间={user.get('room', '无')}")
+    logger.debug("用户登录成功: 账号=%s, 游戏ID=%s, 当前房间=%s", account, user['ID'], user.get('room'))
     return {
         "ok": True,
         "msg": "登录成功",
@@ -405,15 +664,16 @@ def update_user_room(account, room):
         - 记录用户房间变更（从哪个房间到哪个房间）
         - 更新失败时记录错误信息
     """
-    users = load_users()
-    if account in users:
+    with _users_lock:
+        users = load_users()
+        if account not in users:
+            logger.debug("更新用户房间失败: 账号=%s不存在", account)
+            return False
         old_room = users[account].get("room")
         users[account]["room"] = room
         save_users(users)
-        print(f"更新用户房间: 账号={account}, 从房间={old_room}到房间={room}")
-        return True
-    print(f"更新用户房间失败: 账号={account}不存在")
-    return False
+    logger.debug("更新用户房间: 账号=%s, 从房间=%s到房间=%s", account, old_room, room)
+    return True
 
 def get_user(account):
     """
@@ -429,21 +689,14 @@ def get_user(account):
     核心作用：
         - 提供用户数据查询接口
         - 支持内部系统的用户验证和状态检查
+        - 每个Socket事件都会调用，直接查询内存缓存，不做其他处理
     
     安全注意事项：
         - 返回的信息包含敏感数据（如密码哈希）
         - 该函数应仅用于内部系统，不应在API响应中直接返回其结果
-    
-    日志输出：
-        - 记录用户信息查询操作和结果
+        - 返回的是缓存中的记录本身，修改需通过register_user/update_user_room
     """
-    users = load_users()
-    user = users.get(account)
-    if user:
-        print(f"获取用户信息: 账号={account}, 游戏ID={user['ID']}, 完整信息={user}")
-    else:
-        print(f"获取用户信息失败: 账号={account}不存在")
-    return user
+    return load_users().get(account)
 
 '''def init_auth_routes(app):
     
@@ -0,0 +1,98 @@
+# 平台JSON序列化模块
+# 使用orjson替代标准库json，为Flask的jsonify/request.json以及Socket.IO的事件数据
+# 提供更快的序列化与反序列化
+
+import orjson
+from flask.json.provider import JSONProvider
+
+# orjson序列化选项：允许非字符串类型的字典键（与标准库json的行为一致）
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    基于orjson的Flask JSON提供器
+
+    使用方式：
+        app.json = OrjsonProvider(app)
+
+    说明：
+        - orjson直接输出UTF-8，不转义中文等非ASCII字符
+        - 输出为紧凑格式，不带缩进
+    """
+    def dumps(self, obj, **kwargs):
+        """
+        将对象序列化为JSON字符串
+
+        Args:
+            obj: 要序列化的对象
+            **kwargs: 标准库json的参数（如indent、separators），orjson不使用
+
+        Returns:
+            str: JSON字符串
+        """
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        """
+        将JSON字符串或字节解析为Python对象
+
+        Args:
+            s: JSON字符串或字节
+
+        Returns:
+            解析后的Python对象
+        """
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """
+        序列化参数并返回application/json响应
+
+        与JSONProvider.response相同，但直接使用orjson输出的字节作为响应体，
+        省去一次字符串解码和重新编码
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype='application/json'
+        )
+
+
+class OrjsonSocketIOJSON:
+    """
+    供python-socketio/python-engineio使用的JSON模块
+
+    使用方式：
+        SocketIO(app, json=OrjsonSocketIOJSON)
+
+    说明：
+        - Socket.IO的每次emit（房间状态、游戏状态广播等）都会经过这里编码
+        - 接口与标准库json的dumps/loads兼容，多余的参数（如separators）被忽略，
+          orjson的输出本身就是紧凑格式
+    """
+    @staticmethod
+    def dumps(obj, **kwargs):
+        """
+        将事件数据序列化为JSON字符串
+
+        Args:
+            obj: 要序列化的对象
+            **kwargs: 标准库json的参数，orjson不使用
+
+        Returns:
+            str: JSON字符串
+        """
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode('utf-8')
+
+    @staticmethod
+    def loads(s, **kwargs):
+        """
+        将客户端发来的JSON解析为Python对象
+
+        Args:
+            s: JSON字符串或字节
+
+        Returns:
+            解析后的Python对象
+        """
+        return orjson.loads(s)
@@ -1,7 +1,13 @@
 # 房间管理器
 
+import logging
+
+import orjson
+
 from my_modules.games.game_registry import game_registry
 
+logger = logging.getLogger(__name__)
+
 class Room:
     """
     房间类，管理单个房间的状态和玩家
@@ -53,14 +59,13 @@ class Room:
             self.game_info = game_registry.get_game_info(game_id)
 
             # 将房间中的玩家添加到游戏中
-            print(self.game_instance)
-            print(f"roommanager:房间 {self.room_id} 选择游戏: {game_id},info:{self.game_info}")
+            logger.debug("roommanager:房间 %s 选择游戏: %s,info:%s", self.room_id, game_id, self.game_info)
             for account, info in self.players.items():
                 if self.game_instance:
                     self.game_instance.join(account)
-                    print(f"玩家 {account} 加入游戏 {game_id}")
+                    logger.debug("玩家 %s 加入游戏 %s", account, game_id)
             return True
-        print(f"选择游戏失败: 房间 {self.room_id} ")
+        logger.debug("选择游戏失败: 房间 %s ", self.room_id)
         return False
     
     def start_game(self):
@@ -76,19 +81,19 @@ class Room:
         3. 更新房间状态为游戏已开始
         """
         if self.game_instance and not self.game_started:
-            print(f"房间 {self.room_id} 开始游戏: {self.selected_game}")
+            logger.debug("房间 %s 开始游戏: %s", self.room_id, self.selected_game)
             result = self.game_instance.start()
             if result:
                 self.game_started = True  # 设置游戏已开始标志
-                print(f"房间 {self.room_id} 游戏启动成功")
+                logger.debug("房间 %s 游戏启动成功", self.room_id)
                 return {'success': True, 'url': self.game_info['url']}
             else:
-                print(f"房间 {self.room_id} 游戏启动失败")
+                logger.debug("房间 %s 游戏启动失败", self.room_id)
                 return {'success': False, 'url': self.game_info['url']}
         elif self.game_started:
-            print(f"开始游戏失败: 房间 {self.room_id} 游戏已开始")
+            logger.debug("开始游戏失败: 房间 %s 游戏已开始", self.room_id)
         else:
-            print(f"开始游戏失败: 房间 {self.room_id} 游戏实例不存在")
+            logger.debug("开始游戏失败: 房间 %s 游戏实例不存在", self.room_id)
         return False
     
     def is_host(self, account):
@@ -124,6 +129,46 @@ class RoomManager:
     """
     def __init__(self):
         self.rooms = {}  # room_id -> Room实例
+        self._summary_cache = None  # 房间列表摘要(/rooms响应体)缓存，房间变化时置空
+        self._summary_version = 0  # 每次房间变化递增，防止并发时写入过期的摘要
+    
+    def _invalidate_summary(self):
+        """
+        房间创建、加入、离开、选择游戏、开始游戏后调用，使房间列表摘要缓存失效
+        """
+        self._summary_version += 1
+        self._summary_cache = None
+    
+    def get_rooms_summary_json(self):
+        """
+        获取所有房间的摘要信息（已序列化的JSON）
+        
+        只在房间发生变化后的第一次调用时重新生成，其余调用直接返回缓存
+        
+        Returns:
+            bytes: {"rooms": [{"id", "host", "players", "game_selected", "started"}, ...]}
+        """
+        summary = self._summary_cache
+        if summary is not None:
+            return summary
+        
+        version = self._summary_version
+        summary = orjson.dumps({
+            'rooms': [
+                {
+                    'id': room_id,
+                    'host': room.host_account,  # 房主账号
+                    'players': list(room.players),  # 所有玩家账号列表
+                    'game_selected': room.selected_game,  # 是否已选择游戏
+                    'started': room.game_started  # 游戏是否已开始
+                }
+                for room_id, room in list(self.rooms.items())
+            ]
+        })
+        # 生成期间房间又发生了变化时不写入缓存
+        if version == self._summary_version:
+            self._summary_cache = summary
+        return summary
     
     def create_room(self, room_id, host_account, player_info):
         """
@@ -141,6 +186,7 @@ class RoomManager:
             room = Room(room_id, host_account)
             room.add_player(host_account, player_info)
             self.rooms[room_id] = room
+            self._invalidate_summary()
             return room
         return None
     
@@ -171,12 +217,13 @@ class RoomManager:
                 # 如果游戏已选择，将玩家加入游戏实例
                 if room.game_instance:
                     room.game_instance.join(account)
-                print(f"玩家 {account} 加入房间 {room_id} 成功")
+                self._invalidate_summary()
+                logger.debug("玩家 %s 加入房间 %s 成功", account, room_id)
                 return room
             else:
-                print(f"加入房间失败: 房间 {room_id} 游戏已开始")
+                logger.debug("加入房间失败: 房间 %s 游戏已开始", room_id)
         else:
-            print(f"加入房间失败: 房间 {room_id} 不存在")
+            logger.debug("加入房间失败: 房间 %s 不存在", room_id)
         return None
     
     def leave_room(self, room_id, account):
@@ -201,6 +248,7 @@ class RoomManager:
             elif account == room.host_account and room.players:
                 # 重新选择房主
                 room.host_account = next(iter(room.players.keys()))
+            self._invalidate_summary()
     
     def get_room(self, room_id):
         """
@@ -236,7 +284,9 @@ class RoomManager:
         """
         room = self.get_room(room_id)
         if room:
-            return room.select_game(game_id)
+            result = room.select_game(game_id)
+            self._invalidate_summary()
+            return result
         return False
     
     def start_game(self, room_id):
@@ -251,7 +301,9 @@ class RoomManager:
         """
         room = self.get_room(room_id)
         if room:
-            return room.start_game()
+            result = room.start_game()
+            self._invalidate_summary()
+            return result
         return False
     
     def handle_game_event(self, room_id, account, data):
@@ -266,9 +318,8 @@ class RoomManager:
         Returns:
             dict: 事件处理结果
         """
-        print("room_manager:",room_id, account, data)
+        logger.debug("room_manager: 房间 %s 玩家 %s 游戏事件 %s", room_id, account, data.get('event_name'))
         room = self.get_room(room_id)
-        print(room.game_instance)
         if room and room.game_instance:
             return room.game_instance.handle_event(account, data)
         return {'ok': False, 'msg': '游戏未开始'}
@@ -285,9 +336,8 @@ class RoomManager:
         Returns:
             dict: 事件处理结果
         """
-        print("room_manager:",room_id, account)
+        logger.debug("room_manager: 房间 %s 玩家 %s 返回游戏", room_id, account)
         room = self.get_room(room_id)
-        print(room.game_instance)
         if room and room.game_instance:
             return room.game_instance.handle_return(account)
         return {'ok': False, 'msg': '游戏未开始'}
@@ -2,11 +2,15 @@
 # 负责处理所有实时通信事件，包括用户认证、房间管理和游戏流程控制
 # 作为前端和后端服务之间的实时通信桥梁
 
+import logging
+
 from flask_socketio import emit, join_room, leave_room  # Socket.IO功能，用于发送事件和房间管理
 from my_modules.platform.auth import login_user, update_user_room, verify_token  # 导入认证相关功能
 from flask import request
 from my_modules.platform.auth import get_user
 
+logger = logging.getLogger(__name__)
+
 # 存储token到Socket会话ID的映射（用于向特定用户发送消息）
 account_to_sid = {}  # 键: token, 值: socket session id
 # 存储Socket会话ID到token的映射
@@ -48,11 +52,11 @@ def init_socket_events(socketio, room_manager):
                 sid = request.sid
                 account_to_sid[account] = sid
                 sid_to_token[sid] = token
-                print(f"用户通过token连接成功: account={account}, sid={sid}")
+                logger.debug("用户通过token连接成功: account=%s, sid=%s", account, sid)
                 return True
         
         # Token无效或不存在，但仍允许连接（用于登录）
-        print(f"Socket连接: sid={request.sid}, 未提供有效token")
+        logger.debug("Socket连接: sid=%s, 未提供有效token", request.sid)
         return True
     
     # 重新连接事件
@@ -73,29 +77,28 @@ def init_socket_events(socketio, room_manager):
         6. 如果无效，发送错误响应
         """
 
-        print(f"Socket重新连接请求: sid={request.sid}, data={data}")
+        logger.debug("Socket重新连接请求: sid=%s", request.sid)
         token = data.get('token')
-        print(f"token = {token}")
         if token:
             account = verify_token(token)
             if account:
-                print(f"用户通过token重新连接请求: account={account}, sid={request.sid}")
+                logger.debug("用户通过token重新连接请求: account=%s, sid=%s", account, request.sid)
                 sid = request.sid
                 account_to_sid[account] = sid
                 sid_to_token[sid] = token
-                print(f"用户通过token重新连接成功: account={account}, sid={sid}")
+                logger.debug("用户通过token重新连接成功: account=%s, sid=%s", account, sid)
                 
                 # 获取用户房间信息
                 user_info = get_user(account)
                 room_id = user_info.get('room') if user_info else None
                 
                 if room_id:
-                    print(f"用户 {account} 重新连接后加入房间: {room_id}")
+                    logger.debug("用户 %s 重新连接后加入房间: %s", account, room_id)
                     join_room(room_id)
                     
                     room = room_manager.get_room(room_id)
                     if room and room.game_started:
-                        print(f"用户 {account} 重新连接后游戏已开始，获取游戏状态")
+                        logger.debug("用户 %s 重新连接后游戏已开始，获取游戏状态", account)
                         
                         # 调用游戏算法库获取当前游戏状态
                         game_state = room_manager.get_game_state(room_id,account)
@@ -121,7 +124,7 @@ def init_socket_events(socketio, room_manager):
                 return
         
         # Token无效或不存在，发送错误响应
-        print(f"Socket重新连接失败: sid={request.sid}, 无效token")
+        logger.debug("Socket重新连接失败: sid=%s, 无效token", request.sid)
         emit('reconnect_response', {
             'ok': False,
             'msg': '无效的token，重新连接失败'
@@ -162,7 +165,7 @@ def init_socket_events(socketio, room_manager):
             #account_to_sid[account] = sid
             sid_to_token[sid] = token
             
-            print(f"用户 {account} 登录成功，token已生成")
+            logger.debug("用户 %s 登录成功，token已生成", account)
             #暂时退出房间
             leave_room(account)
             # 返回登录结果给客户端（包含token）
@@ -176,7 +179,7 @@ def init_socket_events(socketio, room_manager):
             })
         else:
             # 登录失败，返回错误信息
-            print(f"用户 {account} 登录失败: {result.get('msg')}")
+            logger.debug("用户 %s 登录失败: %s", account, result.get('msg'))
             emit('login_response', {
                 'ok': False,
                 'msg': result['msg']
@@ -210,7 +213,7 @@ def init_socket_events(socketio, room_manager):
         # 获取当前会话对应的用户账号
         token=data.get('token')
         account = verify_token(token)
-        print(f"socket:token = {token}, account = {account}")
+        logger.debug("socket:创建房间请求 account = %s", account)
         # 验证用户是否已登录
         if not account:
             emit('create_room_response', {
@@ -231,7 +234,7 @@ def init_socket_events(socketio, room_manager):
             })
             return
         
-        print(f"用户 {account} 请求创建房间: {room_id}")
+        logger.debug("用户 %s 请求创建房间: %s", account, room_id)
         
         # 创建房间
         room = room_manager.create_room(room_id, account, user_info)
@@ -242,7 +245,7 @@ def init_socket_events(socketio, room_manager):
             # 更新用户房间信息
             update_user_room(account, room_id)
             
-            print(f"房间 {room_id} 创建成功，房主: {account}")
+            logger.debug("房间 %s 创建成功，房主: %s", room_id, account)
             
             # 返回创建成功响应
             emit('create_room_response', {
@@ -259,7 +262,7 @@ def init_socket_events(socketio, room_manager):
             }, room=room_id)
         else:
             # 房间创建失败，返回错误信息
-            print(f"房间 {room_id} 创建失败: 房间已存在")
+            logger.debug("房间 %s 创建失败: 房间已存在", room_id)
             emit('create_room_response', {
                 'ok': False,
                 'msg': '房间已存在'
@@ -315,7 +318,7 @@ def init_socket_events(socketio, room_manager):
             })
             return
         
-        print(f"用户 {account} 请求加入房间: {room_id}")
+        logger.debug("用户 %s 请求加入房间: %s", account, room_id)
         
         # 尝试加入房间
         room = room_manager.join_room(room_id, account, user_info)
@@ -331,7 +334,7 @@ def init_socket_events(socketio, room_manager):
             # if room.game_instance and account in room.game_instance.players:
             #     order = room.game_instance.players[account][1]  # 假设players结构为{account: [ID, order, ...]}
             
-            print(f"用户 {account} 成功加入房间: {room_id}")
+            logger.debug("用户 %s 成功加入房间: %s", account, room_id)
             
             # 返回加入成功响应
             emit('join_room_response', {
@@ -351,7 +354,7 @@ def init_socket_events(socketio, room_manager):
             }, room=room_id)
         else:
             # 加入失败，返回错误信息
-            print(f"用户 {account} 加入房间 {room_id} 失败")
+            logger.debug("用户 %s 加入房间 %s 失败", account, room_id)
             emit('join_room_response', {
                 'ok': False,
                 'msg': '房间不存在或游戏已开始'
@@ -392,7 +395,7 @@ def init_socket_events(socketio, room_manager):
         room_id = user_info.get('room') if user_info else None
         
         if room_id:
-            print(f"用户 {account} 请求离开房间: {room_id}")
+            logger.debug("用户 %s 请求离开房间: %s", account, room_id)
             
             # 从房间管理器中离开房间
             room_manager.leave_room(room_id, account)
@@ -401,7 +404,7 @@ def init_socket_events(socketio, room_manager):
             # 更新用户房间信息为空
             update_user_room(account, None)
             
-            print(f"用户 {account} 已离开房间: {room_id}")
+            logger.debug("用户 %s 已离开房间: %s", account, room_id)
             
             # 广播房间信息更新给剩余用户
             room = room_manager.get_room(room_id)
@@ -477,13 +480,13 @@ def init_socket_events(socketio, room_manager):
             })
             return
         
-        print(f"房主 {account} 在房间 {room_id} 选择游戏: {game_id}")
+        logger.debug("房主 %s 在房间 %s 选择游戏: %s", account, room_id, game_id)
         
         # 尝试选择游戏
         result = room_manager.select_game(room_id, game_id)
         
         if result:
-            print(f"房间 {room_id} 游戏选择成功: {game_id}")
+            logger.debug("房间 %s 游戏选择成功: %s", room_id, game_id)
             
             # 返回选择成功响应
             emit('select_game_response', {
@@ -497,7 +500,7 @@ def init_socket_events(socketio, room_manager):
                 'game_id': game_id
             }, room=room_id)
         else:
-            print(f"房间 {room_id} 游戏选择失败: {game_id}")
+            logger.debug("房间 %s 游戏选择失败: %s", room_id, game_id)
             
             # 选择失败，返回错误信息
             emit('select_game_response', {
@@ -536,7 +539,7 @@ def init_socket_events(socketio, room_manager):
         token=data.get('token')
         account = verify_token(token)
         
-        print(f"socket:收到用户 {account} 的开始游戏事件: {data}")
+        logger.debug("socket:收到用户 %s 的开始游戏事件", account)
         # 验证用户是否已登录
         if not account:
             emit('start_game_response', {
@@ -574,7 +577,7 @@ def init_socket_events(socketio, room_manager):
             })
             return
         
-        print(f"房主 {account} 请求在房间 {room_id} 开始游戏: {room.selected_game}")
+        logger.debug("房主 %s 请求在房间 %s 开始游戏: %s", account, room_id, room.selected_game)
         
         # 尝试开始游戏
         result = room_manager.start_game(room_id)
@@ -583,7 +586,7 @@ def init_socket_events(socketio, room_manager):
             # 获取初始游戏状态
             game_state = room_manager.get_game_state(room_id,account)
             
-            print(f"房间 {room_id} 游戏 {room.selected_game} 开始成功")
+            logger.debug("房间 %s 游戏 %s 开始成功", room_id, room.selected_game)
             
             # 返回开始成功响应
             emit('start_game_response', {
@@ -592,7 +595,7 @@ def init_socket_events(socketio, room_manager):
             })
             # 广播游戏开始事件，包含游戏状态
             url = result.get('url')
-            print(f"socket:游戏开始成功，重定向URL: {url}")
+            logger.debug("socket:游戏开始成功，重定向URL: %s", url)
             emit('game_started', {
                 'room_id': room_id,
                 'game_id': room.selected_game,
@@ -600,7 +603,7 @@ def init_socket_events(socketio, room_manager):
                 'redirect_url': url
             }, room=room_id)
         else:
-            print(f"房间 {room_id} 游戏开始失败")
+            logger.debug("房间 %s 游戏开始失败", room_id)
             
             # 开始失败，返回错误信息
             emit('start_game_response', {
@@ -635,10 +638,10 @@ def init_socket_events(socketio, room_manager):
         token=data.get('token')
         account = verify_token(token)
         
-        print(f"socket:收到用户 {account} 的游戏事件: {data}")
+        logger.debug("socket:收到用户 %s 的游戏事件: %s", account, data.get('event_name'))
         # 验证用户是否已登录
         if not account:
-            print(f"socket:用户 {account} 未登录，无法发送游戏事件")   
+            logger.debug("socket:用户 %s 未登录，无法发送游戏事件", account)
             emit('game_event_result', {
                 'ok': False,
                 'msg': '请先登录'
@@ -659,18 +662,18 @@ def init_socket_events(socketio, room_manager):
             })
             return
 
-        print(f"socket:收到房间 {room_id} 的游戏事件: {event_name}")
+        logger.debug("socket:收到房间 %s 的游戏事件: %s", room_id, event_name)
         # 验证房间是否存在且游戏已开始
         room = room_manager.get_room(room_id)
         if not room or not room.game_started:
-            print(f"socket:房间 {room_id} 游戏未开始，无法处理游戏事件")
+            logger.debug("socket:房间 %s 游戏未开始，无法处理游戏事件", room_id)
             emit('game_event_result', {
                 'ok': False,
                 'msg': '游戏未开始'
             })
             return
         
-        print(f"用户 {account} 在房间 {room_id} 发送游戏事件: {event_name}, data={data}")
+        logger.debug("用户 %s 在房间 %s 发送游戏事件: %s, event_data=%s", account, room_id, event_name, data.get('event_data'))
         
         # 调用房间管理器处理游戏事件
         result = room_manager.handle_game_event(room_id, account, data)
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+生产环境入口
+
+模块概述：
+    供gunicorn使用的WSGI入口。开发环境仍可直接运行 python app.py（Werkzeug开发服务器）。
+    eventlet必须在导入Flask等其他模块之前完成monkey patch，因此单独放在这个文件里，
+    不影响app.py的直接运行。
+
+运行方式：
+    pip install eventlet gunicorn
+    gunicorn -k eventlet -w 1 --worker-connections 2000 -b 0.0.0.0:5000 wsgi:app
+
+注意事项：
+    - 房间和游戏状态保存在进程内存中，worker数量必须保持为1
+    - 设置REDIS_URL后，登录token保存在Redis中，重启进程后用户无需重新登录
+"""
+
+import eventlet
+
+eventlet.monkey_patch()
+
+from app import app, socketio  # noqa: E402,F401